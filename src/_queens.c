@@ -0,0 +1,19 @@
+/* Native bitmask validator for the Queens placement rules.
+ *
+ * Mirrors _is_valid_masks in game.py; build it once with
+ *
+ *     cc -O2 -shared -fPIC -o src/_queens.so src/_queens.c
+ *
+ * and game.py picks it up automatically via ctypes.
+ */
+#include <stdint.h>
+
+/* corner_bits is the OR of the neighboring columns' occupancy masks. */
+int is_valid_masks(uint64_t row_mask, uint64_t col_mask, uint64_t corner_bits,
+                   int x, int y) {
+    if ((row_mask >> y) & 1)
+        return 0;
+    if ((col_mask >> x) & 1)
+        return 0;
+    return !(((corner_bits << 1) >> y) & 5);
+}
@@ -7,23 +7,69 @@ The color zones can take up any number of adjacent tiles.
 The zones force the grid to only have a single possible solution.
 """
 
+import ctypes
 import pygame
 import logging
 import numpy as np
+from pathlib import Path
 from config import color_map
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional speedup; fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+@njit(cache=True)
+def _is_valid_masks(row_mask: int, col_mask: int, corner_bits: int, x: int, y: int):
+    """Bitwise row/column/corner test on int64 masks, kept free of Python
+    objects so Numba can compile it for tight solver loops"""
+    if (row_mask >> y) & 1:
+        return False
+    if (col_mask >> x) & 1:
+        return False
+    return not ((corner_bits << 1) >> y) & 0b101
+
+
+# Prefer the native validator from _queens.c when it has been built
+# (cc -O2 -shared -fPIC -o src/_queens.so src/_queens.c)
+try:
+    _queens_lib = ctypes.CDLL(str(Path(__file__).with_name("_queens.so")))
+    _queens_lib.is_valid_masks.argtypes = [ctypes.c_uint64] * 3 + [ctypes.c_int] * 2
+    _queens_lib.is_valid_masks.restype = ctypes.c_int
+    _is_valid_masks = _queens_lib.is_valid_masks
+except OSError:
+    pass
+
 
 class Queens:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.n = None
         self.grid = np.array([])
+        self.row_mask = 0  # Bitboard of occupied rows (bit y set = queen in row y)
+        self.col_mask = 0  # Bitboard of occupied columns (bit x set)
+        # Per-column bitmask of queen cells for the corner check, padded
+        # with a zero sentinel on each side (column x lives at index x + 1)
+        self.row_bits = []
         self.queens = []
         self.color_zones = []
-        self.color_zone_queens = {}
+        self.zone_lookup = np.array([])  # (n, n) map of cell -> color zone index
+        self.zone_color = []  # Color name for each color zone index
+        self.zone_rgb = np.array([])  # RGB palette indexed by color zone index
+        self.zone_mask = 0  # Bitboard of occupied zones (bit = zone index)
+        self.zone_queen_pos = np.array([])  # Per-zone queen (x, y); -1 = empty
         self.queen_image = pygame.image.load(
             "assets/images/queen_icon.jpg"
         )  # Default queen image
+        self.scaled_queen = None  # Queen image scaled to cell size, built in run()
+        self.background = None  # Static board (frame + cells + zones), built in run()
+        self._zone_fills = []  # (rect, color) pairs for the zone paint
 
     def initialize_game(self, game_config: dict):
         """
@@ -34,69 +80,87 @@ class Queens:
         """
         self.n = game_config["n"]
 
-        # Initialize the grid
-        self.grid = np.zeros((self.n, self.n))
-        self.logger.info(f"Initialized {self.n}x{self.n} grid")
+        # Initialize the grid; cells only hold {-1, 0, 1} so int8 is plenty
+        self.grid = np.zeros((self.n, self.n), dtype=np.int8)
+        self.row_mask = 0
+        self.col_mask = 0
+        self.row_bits = [0] * (self.n + 2)
+        self.logger.info("Initialized %dx%d grid", self.n, self.n)
 
         # Initialize the color zones from game config
         self.color_zones = game_config["color_zones"]
-        self.logger.info(f"Initialized {len(self.color_zones)} color zones")
+        self.logger.info("Initialized %d color zones", len(self.color_zones))
+
+        # Precompute the cell -> color zone lookup so get_color_zone is a
+        # single array load instead of a scan over every zone
+        self.zone_lookup = np.full((self.n, self.n), -1, dtype=np.int8)
+        self.zone_color = []
+        self.zone_mask = 0
+        self.zone_queen_pos = np.full((len(self.color_zones), 2), -1, dtype=np.int16)
+        for color_index, color_zone in enumerate(self.color_zones):
+            self.zone_color.append(color_zone["color"])
+            x_coords = np.asarray(color_zone["x"])
+            y_coords = np.asarray(color_zone["y"])
+            self.zone_lookup[x_coords, y_coords] = color_index
+
+        # Resolve each zone's color name to RGB once; the trailing white row
+        # is what the unzoned sentinel index (-1) resolves to
+        self.zone_rgb = np.array(
+            [color_map[color] for color in self.zone_color] + [(255, 255, 255)],
+            dtype=np.uint8,
+        )
 
         # Store the queen positions from game config
         self.queens = game_config["queens"]
-        self.logger.info(f"Stored {len(self.queens)} queens")
+        self.logger.info("Stored %d queens", len(self.queens))
 
         # Load the queen image
         if game_config.get("queen_image"):
             self.queen_image = pygame.image.load(game_config["queen_image"])
 
-        # Print grid
-        self.logger.info(f"Grid: {self.grid}")
+        # Print grid; repr of the full array is O(n^2) string work,
+        # so only build it when debug logging is actually on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Grid: %s", self.grid)
 
     def is_queen_same_column(self, x: int) -> bool:
         """Check if the queen is in the same column as another queen"""
-        if self.grid[x].sum() == 1:
-            return True
-        return False
+        return bool((self.col_mask >> x) & 1)
 
     def is_queen_same_row(self, y: int) -> bool:
         """Check if the queen is in the same row as another queen"""
-        if self.grid[:, y].sum() == 1:
-            return True
-        return False
+        return bool((self.row_mask >> y) & 1)
 
     def get_color_zone(self, x: int, y: int) -> bool:
         """Get the color zone of the coordinates"""
-        for color_zone in self.color_zones:
-            x_coords = color_zone["x"]
-            y_coords = color_zone["y"]
-            for x_coord, y_coord in zip(x_coords, y_coords):
-                if x == x_coord and y == y_coord:
-                    return color_zone["color"]
-        return None
+        color_index = self.zone_lookup[x, y]
+        if color_index < 0:
+            return None
+        return self.zone_color[color_index]
 
     def is_queen_same_color_zone(self, x: int, y: int) -> bool:
         """Check if the queen is in the same color zone as another queen"""
-        queen_color_zone = self.get_color_zone(x, y)
-        if queen_color_zone is not None:
-            return queen_color_zone in self.color_zone_queens.keys()
-        return False
+        # Cast to a Python int: shifting by an int8 under NumPy 2.x promotion
+        # wraps at 8 bits and overflows once the mask outgrows one byte
+        color_index = int(self.zone_lookup[x, y])
+        if color_index < 0:
+            return False
+        return bool((self.zone_mask >> color_index) & 1)
 
     def is_queen_same_corner(self, x: int, y: int) -> bool:
         """Check if the queen is in the corner of another queen"""
-        corners = []
-        if x > 0 and y > 0:  # Top-left corner
-            corners.append(self.grid[x - 1][y - 1])
-        if x > 0 and y < self.n - 1:  # Top-right corner
-            corners.append(self.grid[x - 1][y + 1])
-        if x < self.n - 1 and y > 0:  # Bottom-left corner
-            corners.append(self.grid[x + 1][y - 1])
-        if x < self.n - 1 and y < self.n - 1:  # Bottom-right corner
-            corners.append(self.grid[x + 1][y + 1])
-
-        if 1 in corners:
-            return True
-        return False
+        # The sentinel padding makes both neighbor loads branchless; shifting
+        # left first keeps y == 0 in bounds
+        neighbors = self.row_bits[x] | self.row_bits[x + 2]
+        return bool(((neighbors << 1) >> y) & 0b101)
+
+    def is_valid(self, x: int, y: int) -> bool:
+        """Fast placement check for the event loop: short-circuits on the
+        first violated rule and builds no diagnostics"""
+        corner_bits = self.row_bits[x] | self.row_bits[x + 2]
+        if not _is_valid_masks(self.row_mask, self.col_mask, corner_bits, x, y):
+            return False
+        return not self.is_queen_same_color_zone(x, y)
 
     def is_queen_correct(self, x: int, y: int) -> dict:
         """Check if queen placement adheres to game rules:
@@ -116,7 +180,7 @@ class Queens:
         checks["color_zone"] = not self.is_queen_same_color_zone(x, y)
         checks["corner"] = not self.is_queen_same_corner(x, y)
 
-        self.logger.info(f"Checks: {checks}")
+        self.logger.info("Checks: %s", checks)
 
         return checks
 
@@ -147,40 +211,31 @@ class Queens:
         )
         pygame.draw.rect(screen, (0, 0, 0), frame_rect, 2)  # Black frame
 
-    def display_grid(
+    def build_static_rects(
         self,
-        screen: pygame.Surface,
         GRID_SIZE: int,
         TITLE_HEIGHT: int,
         FRAME_PADDING: int,
     ):
-        # Draw grid and color zones
-        for i in range(self.n):
-            for j in range(self.n):
-                cell_x = FRAME_PADDING + (i * GRID_SIZE)
-                cell_y = TITLE_HEIGHT + FRAME_PADDING + (j * GRID_SIZE)
-                pygame.draw.rect(
-                    screen, (255, 255, 255), (cell_x, cell_y, GRID_SIZE, GRID_SIZE)
+        """Precompute the zone fill rects and colors for the board"""
+        self._zone_fills = []
+        for color_index, color_zone in enumerate(self.color_zones):
+            color = tuple(self.zone_rgb[color_index])
+            cell_xs = FRAME_PADDING + np.asarray(color_zone["x"]) * GRID_SIZE
+            cell_ys = (
+                TITLE_HEIGHT + FRAME_PADDING + np.asarray(color_zone["y"]) * GRID_SIZE
+            )
+            for cell_x, cell_y in zip(cell_xs, cell_ys):
+                self._zone_fills.append(
+                    (pygame.Rect(cell_x, cell_y, GRID_SIZE, GRID_SIZE), color)
                 )
 
-    def display_color_zones(
-        self,
-        screen: pygame.Surface,
-        GRID_SIZE: int,
-        TITLE_HEIGHT: int,
-        FRAME_PADDING: int,
-    ):
-        ## Display color zones
-        for color_zone in self.color_zones:
-            color = color_zone["color"]
-            x_coords = color_zone["x"]
-            y_coords = color_zone["y"]
-            for x_coord, y_coord in zip(x_coords, y_coords):
-                cell_x = FRAME_PADDING + (x_coord * GRID_SIZE)
-                cell_y = TITLE_HEIGHT + FRAME_PADDING + (y_coord * GRID_SIZE)
-                pygame.draw.rect(
-                    screen, color_map[color], (cell_x, cell_y, GRID_SIZE, GRID_SIZE)
-                )
+    def _paint_static(self, screen: pygame.Surface):
+        """Paint the color zones from the prebuilt list; unzoned cells keep
+        the white window background"""
+        fill = screen.fill
+        for rect, color in self._zone_fills:
+            fill(color, rect)
 
     def run(self):
         # Constants for UI layout
@@ -198,7 +253,16 @@ class Queens:
         screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 
         pygame.display.set_caption("Queens")
-        clock = pygame.time.Clock()
+
+        # Keep events we never handle out of the queue so the blocking
+        # event loop is not woken by mouse movement
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT])
+
+        # Scale the queen image to the cell size once; rescaling and
+        # converting the source image per click is wasteful
+        self.scaled_queen = pygame.transform.smoothscale(
+            self.queen_image, (GRID_SIZE, GRID_SIZE)
+        ).convert_alpha()
 
         # Initialize fonts
         title_font = pygame.font.Font(None, 48)
@@ -208,97 +272,143 @@ class Queens:
         n_valid_queens = 0
         running = True
 
+        # Wake the loop once a second for the clock instead of polling
+        pygame.time.set_timer(pygame.USEREVENT, 1000)
+
         # Display the grid
         screen.fill((255, 255, 255))  # White background
 
         self.display_title(screen, title_font, WINDOW_WIDTH, TITLE_HEIGHT)
         self.display_frame(screen, GRID_SIZE, TITLE_HEIGHT, FRAME_PADDING)
-        self.display_grid(screen, GRID_SIZE, TITLE_HEIGHT, FRAME_PADDING)
-        self.display_color_zones(screen, GRID_SIZE, TITLE_HEIGHT, FRAME_PADDING)
+        self.build_static_rects(GRID_SIZE, TITLE_HEIGHT, FRAME_PADDING)
+        self._paint_static(screen)
+        pygame.display.update()
+
+        # Keep a copy of the freshly painted board; restoring a cell is then
+        # a single blit from this surface instead of redrawing its zone
+        self.background = screen.copy().convert()
+
+        # Only flush regions that actually changed each frame
+        time_rect = pygame.Rect(
+            FRAME_PADDING, FRAME_PADDING // 2, 130, 30
+        )  # Width=130 to fit time text
+        dirty = []
+        minutes = 0
+        seconds = 0
+        last_elapsed = -1
+        time_surf = None  # Rendered clock text, rebuilt once per second
+
+        # Bind hot state to locals; each self. access inside the loop is a
+        # dict probe
+        n = self.n
+        grid = self.grid
+        row_bits = self.row_bits
+        zone_lookup = self.zone_lookup
+        zone_queen_pos = self.zone_queen_pos
+        zone_color = self.zone_color
+        zone_rgb = self.zone_rgb
+        background = self.background
+        scaled_queen = self.scaled_queen
+        logger = self.logger
 
         while running:
+            # Block until something happens (click, timer tick, quit),
+            # then drain whatever else is queued
+            events = [pygame.event.wait(), *pygame.event.get()]
+
             # Calculate elapsed time
             elapsed_time = (
                 pygame.time.get_ticks() - start_time
             ) // 1000  # Convert to seconds
-            minutes = elapsed_time // 60
-            seconds = elapsed_time % 60
-
-            # Clear previous time text area with background color
-            time_rect = pygame.Rect(
-                FRAME_PADDING, FRAME_PADDING // 2, 130, 30
-            )  # Width=150 to fit time text
-            pygame.draw.rect(
-                screen, (255, 255, 255), time_rect
-            )  # Fill with white background
-
-            time_text = clock_font.render(
-                f"Time: {minutes:02d}:{seconds:02d}", True, (0, 0, 0)
-            )
-            screen.blit(time_text, (FRAME_PADDING, FRAME_PADDING // 2))
+
+            # Only redraw the clock when the displayed second ticks over
+            if elapsed_time != last_elapsed:
+                last_elapsed = elapsed_time
+                minutes = elapsed_time // 60
+                seconds = elapsed_time % 60
+
+                # Clear previous time text area with background color
+                screen.fill((255, 255, 255), time_rect)
+
+                # Rasterizing text is heavy, so only render on tick-over
+                time_surf = clock_font.render(
+                    f"Time: {minutes:02d}:{seconds:02d}", True, (0, 0, 0)
+                )
+                dirty.append(time_rect)
+
+            screen.blit(time_surf, (FRAME_PADDING, FRAME_PADDING // 2))
 
             # Update the display when user places a queen
-            for event in pygame.event.get():
+            for event in events:
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 3):
+                    # Convert the click position to a cell once, shared by
+                    # both buttons; ignore clicks outside the board
+                    px, py = event.pos
+                    x = (px - FRAME_PADDING) // GRID_SIZE
+                    y = (py - (TITLE_HEIGHT + FRAME_PADDING)) // GRID_SIZE
+                    if not (0 <= x < n and 0 <= y < n):
+                        continue
+                    cell_x = FRAME_PADDING + (x * GRID_SIZE)
+                    cell_y = TITLE_HEIGHT + FRAME_PADDING + (y * GRID_SIZE)
+                    cell_rect = pygame.Rect(cell_x, cell_y, GRID_SIZE, GRID_SIZE)
+
                 # If it is a left click, place or remove a queen
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    x, y = pygame.mouse.get_pos()
-                    x = (x - FRAME_PADDING) // GRID_SIZE
-                    y = (y - (TITLE_HEIGHT + FRAME_PADDING)) // GRID_SIZE
-
                     # If the cell is already a queen, remove it
-                    if self.grid[x][y] == 1:
-                        self.grid[x][y] = 0
+                    if grid[x, y] == 1:
+                        grid[x, y] = 0
+                        self.row_mask ^= 1 << y
+                        self.col_mask ^= 1 << x
+                        row_bits[x + 1] ^= 1 << y
                         n_valid_queens -= 1
 
-                        queen_color_zone = self.get_color_zone(x, y)
-                        if queen_color_zone in self.color_zone_queens.keys():
-                            del self.color_zone_queens[queen_color_zone]
+                        zone_index = int(zone_lookup[x, y])
+                        if zone_index >= 0:
+                            self.zone_mask &= ~(1 << zone_index)
+                            zone_queen_pos[zone_index] = -1
 
-                        # Remove the queen image from the screen
-                        screen.blit(pygame.Surface((100, 100)), (x * 100, y * 100))
-                        # Add color zone back to the screen
-                        color = color_map[queen_color_zone]
-                        pygame.draw.rect(screen, color, (x * 100, y * 100, 100, 100))
+                        # Restore the cell from the pre-rendered background
+                        screen.blit(background, cell_rect, cell_rect)
+                        dirty.append(cell_rect)
 
                     # If the cell is not a queen, place a queen (if valid)
                     else:
                         # Check if queen placement adheres to game rules
-                        checks = self.is_queen_correct(x, y)
-                        if all(checks.values()):
-                            self.logger.info("Queen placement is valid")
-                            self.grid[x][y] = 1
+                        if self.is_valid(x, y):
+                            logger.info("Queen placement is valid")
+                            grid[x, y] = 1
+                            self.row_mask ^= 1 << y
+                            self.col_mask ^= 1 << x
+                            row_bits[x + 1] ^= 1 << y
                             n_valid_queens += 1
 
-                            # Add queen to color zone
-                            queen_color_zone = self.get_color_zone(x, y)
-                            self.color_zone_queens[queen_color_zone] = (x, y)
-                            self.logger.info(
-                                f"Added queen to color zone {queen_color_zone}: {self.color_zone_queens[queen_color_zone]}"
-                            )
-
-                            # Resize queen image to fit grid cell (100x100)
-                            scaled_queen = pygame.transform.scale(
-                                self.queen_image, (100, 100)
-                            )
-                            cell_x = FRAME_PADDING + (x * GRID_SIZE)
-                            cell_y = TITLE_HEIGHT + FRAME_PADDING + (y * GRID_SIZE)
+                            # Add queen to color zone, if the cell has one
+                            zone_index = int(zone_lookup[x, y])
+                            if zone_index >= 0:
+                                self.zone_mask |= 1 << zone_index
+                                zone_queen_pos[zone_index] = (x, y)
+                                logger.info(
+                                    "Added queen to color zone %s: %s",
+                                    zone_color[zone_index],
+                                    (x, y),
+                                )
+
                             screen.blit(scaled_queen, (cell_x, cell_y))
+                            dirty.append(cell_rect)
                         else:
-                            self.logger.info("Queen placement is invalid")
+                            logger.info("Queen placement is invalid")
+                            # Only build the per-rule diagnostics on failure
+                            checks = self.is_queen_correct(x, y)
                             for key, value in checks.items():
                                 if not value:
-                                    self.logger.info(
-                                        f"There is another queen in the same {key}."
+                                    logger.info(
+                                        "There is another queen in the same %s.",
+                                        key,
                                     )
 
                 #  If it is a right click, add or remove a cross to the cell
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
-                    x, y = pygame.mouse.get_pos()
-                    x = (x - FRAME_PADDING) // GRID_SIZE
-                    y = (y - (TITLE_HEIGHT + FRAME_PADDING)) // GRID_SIZE
-                    cell_x = FRAME_PADDING + (x * GRID_SIZE)
-                    cell_y = TITLE_HEIGHT + FRAME_PADDING + (y * GRID_SIZE)
-                    if self.grid[x][y] == 0:
+                    if grid[x, y] == 0:
                         # Add a cross to the cell
                         pygame.draw.line(
                             screen,
@@ -314,12 +424,12 @@ class Queens:
                             (cell_x, cell_y + GRID_SIZE),
                             5,
                         )
-                        self.grid[x][y] = -1
+                        grid[x, y] = -1
+                        dirty.append(cell_rect)
 
-                    elif self.grid[x][y] == -1:
+                    elif grid[x, y] == -1:
                         # Remove the cross from the cell
-                        queen_color_zone = self.get_color_zone(x, y)
-                        color = color_map.get(queen_color_zone)
+                        color = zone_rgb[zone_lookup[x, y]]
 
                         pygame.draw.line(
                             screen,
@@ -335,20 +445,23 @@ class Queens:
                             (cell_x, cell_y + GRID_SIZE),
                             5,
                         )
-                        self.grid[x][y] = 0
+                        grid[x, y] = 0
+                        dirty.append(cell_rect)
 
                 if event.type == pygame.QUIT:
                     pygame.quit()
 
                 # Check if the user has placed all queens
-                if n_valid_queens == self.n:
-                    self.logger.info("All queens are placed correctly!")
+                if n_valid_queens == n:
+                    logger.info("All queens are placed correctly!")
                     running = False
                     break
 
-            # Update the display
-            pygame.display.update()
-            clock.tick(60)
+            # Flush only the regions that changed this frame
+            pygame.display.update(dirty)
+            dirty.clear()
+
+        pygame.time.set_timer(pygame.USEREVENT, 0)
 
         # Display the final time
         final_time_text = clock_font.render(
@@ -4,6 +4,7 @@ Each Queen is also contained by a unique color zone, where each color zone only
 The color zones can take up any number of adjacent tiles.
 The zones force the grid to only have a single possible solution."""
 
+import numpy as np
 from config import color_map
 
 
@@ -22,23 +23,25 @@ def generate_color_zones(queens_positions: list[tuple[int, int]]) -> list[dict]:
         {"color": "yellow", "x": [0, 1, 2, 2, 3, 3], "y": [3, 3, 2, 3, 2, 3]}
         ]
     """
-    color_zones = []
     n = len(queens_positions)
+    positions = np.asarray(queens_positions)
 
     # Get the unique colors from color_map
     queen_colors = list(color_map.keys())[:n]
 
-    # Initialize the color zones
-    for color in queen_colors:
-        color_zones.append(
-            {
-                "color": color,
-                "x": [queen["x"] for queen in queens_positions],
-                "y": [queen["y"] for queen in queens_positions],
-            }
-        )
+    # Initialize each color zone with just its own queen's cell; previously
+    # every zone got a copy of the full queens list
+    color_zones = [
+        {
+            "color": color,
+            "x": [int(positions[i, 0])],
+            "y": [int(positions[i, 1])],
+        }
+        for i, color in enumerate(queen_colors)
+    ]
 
     # Generate the color zones
-    # TODO: Implement the logic to generate the color zones
+    # TODO: Grow the zones over adjacent tiles (flood fill) so the board
+    # has a unique solution
 
     return color_zones
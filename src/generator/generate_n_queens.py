@@ -2,33 +2,90 @@
 
 import logging
 import numpy as np
-from ortools.sat.python import cp_model
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is an optional speedup; fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        return wrap
+
+    prange = range
+
+
+@njit(cache=True)
+def _solve_nq_into(n: int, order: np.ndarray, columns: np.ndarray):
+    """Bit-parallel backtracking solver for the Queens placement rules.
+
+    Places one queen per row such that no column repeats and no queen is
+    diagonally adjacent to the queen in the previous row (the game only
+    bans touching diagonals, not full diagonals). Occupied columns are a
+    single int bitmask, so each candidate test is one AND. Candidate
+    columns are tried in the given order, so a shuffled order yields a
+    different board. Fills the chosen column per row into `columns`, with
+    columns[0] == -1 if no placement exists.
+    """
+    picks = np.full(n, -1, dtype=np.int64)  # Index into order, per row
+    used = 0  # Bitmask of occupied columns
+    row = 0
+    candidate = 0
+    while 0 <= row < n:
+        if row > 0:
+            prev_bit = 1 << columns[row - 1]
+            banned = used | (prev_bit << 1) | (prev_bit >> 1)
+        else:
+            banned = used
+        placed = False
+        while candidate < n:
+            column = order[candidate]
+            bit = 1 << column
+            if not (banned & bit):
+                picks[row] = candidate
+                columns[row] = column
+                used |= bit
+                row += 1
+                candidate = 0
+                placed = True
+                break
+            candidate += 1
+        if not placed:
+            # Dead end: undo the previous row and resume after its pick
+            row -= 1
+            if row >= 0:
+                used &= ~(1 << columns[row])
+                candidate = picks[row] + 1
+    if row < 0:
+        columns[0] = -1
+
+
+@njit(parallel=True, cache=True)
+def _solve_batch(n: int, k: int, out: np.ndarray):
+    """Solve k boards into out (k, n), one per thread, seeded per board"""
+    for b in prange(k):
+        np.random.seed(b)
+        _solve_nq_into(n, np.random.permutation(n), out[b])
 
 
 def place_n_queens(n, logger: logging.Logger) -> list[tuple[int, int]]:
     """Solves the N-Queens problem and returns a valid placement."""
 
-    logger.info(f"Placing N-Queens for {n}x{n} grid")
-    model = cp_model.CpModel()
-    queens = [model.NewIntVar(0, n - 1, f"Q{i}") for i in range(n)]
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            model.Add(queens[i] != queens[j])  # No same row
-            model.Add(queens[i] != queens[j])  # No same column
+    logger.info("Placing N-Queens for %dx%d grid", n, n)
+    columns = np.full(n, -1, dtype=np.int64)
+    _solve_nq_into(n, np.arange(n), columns)
+    if columns[0] < 0:
+        raise ValueError(f"No valid queen placement exists for n={n}")
+    return [(i, int(columns[i])) for i in range(n)]
 
-            # Check only immediate diagonal corners (distance of 1)
-            if j - i == 1:  # Only check adjacent queens
-                # Create a new variable for the absolute difference
-                abs_diff = model.NewIntVar(0, n - 1, f"abs_diff_{i}_{j}")
-                # Use add_abs_equality to handle absolute value
-                model.AddAbsEquality(abs_diff, queens[i] - queens[j])
-                # Ensure the absolute difference is not 1
-                model.Add(abs_diff != 1)
 
-    solver = cp_model.CpSolver()
-    solver.Solve(model)
-    return [(i, solver.Value(queens[i])) for i in range(n)]
+def generate_batch(n: int, k: int) -> list[list[tuple[int, int]]]:
+    """Generate k distinct-seeded queen placements in one parallel call,
+    for building puzzle libraries without paying per-call overhead."""
+    out = np.empty((k, n), dtype=np.int64)
+    _solve_batch(n, k, out)
+    return [[(i, int(out[b, i])) for i in range(n)] for b in range(k) if out[b, 0] >= 0]
 
 
 if __name__ == "__main__":
@@ -39,10 +96,10 @@ if __name__ == "__main__":
 
     n = 8
     queens_positions = place_n_queens(n, logger)
-    logger.info(f"Queens positions: {queens_positions}")
+    logger.info("Queens positions: %s", queens_positions)
 
     # Create a grid
     grid = np.zeros((n, n))
     for i, j in queens_positions:
         grid[i, j] = 1
-    logger.info(f"Grid: {grid}")
+    logger.info("Grid: %s", grid)
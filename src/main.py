@@ -5,14 +5,37 @@ Main file to run the game
 import logging
 import argparse
 import json
+import os
+from functools import lru_cache
 from game import Queens
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
+
+@lru_cache(maxsize=64)
+def _load_game_config(path: str, mtime_ns: int) -> dict:
+    """Parse a game config, cached on path and mtime so batch callers
+    invoking main repeatedly only pay for the first load"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_game_config(path: str) -> dict:
+    """Load the game config at path, re-reading only when the file changes"""
+    return _load_game_config(path, os.stat(path).st_mtime_ns)
+
 
 def main(game_config_path: str, logger: logging.Logger):
     queens = Queens(logger)
     # Read the game config
-    with open(game_config_path, "r") as f:
-        game_config = json.load(f)
+    game_config = load_game_config(game_config_path)
     queens.initialize_game(game_config)
     queens.run()
 